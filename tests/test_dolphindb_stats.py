@@ -0,0 +1,135 @@
+import pandas as pd
+import pytest
+
+from vnpy_dolphindb.dolphindb_stats import (
+    StatsRecorder,
+    CallRecord,
+    CallTimer,
+    NullTimer
+)
+
+
+def test_disabled_returns_null_timer() -> None:
+    """关闭统计时返回空计时器且不产生数据"""
+    recorder: StatsRecorder = StatsRecorder()
+
+    with recorder.start("load_bar_data") as timer:
+        assert isinstance(timer, NullTimer)
+        timer.phase("query")
+        timer.add_rows(10)
+
+    assert recorder.get_snapshot() == {}
+
+
+def test_phases_rows_and_bytes() -> None:
+    """分阶段耗时、行数和字节数的累计"""
+    recorder: StatsRecorder = StatsRecorder()
+    recorder.enabled = True
+
+    df: pd.DataFrame = pd.DataFrame({"close_price": [1.0, 2.0, 3.0]})
+
+    for _ in range(2):
+        with recorder.start("load_bar_data") as timer:
+            assert isinstance(timer, CallTimer)
+            timer.add_frame(df)
+            timer.phase("query")
+            timer.phase("build")
+            timer.phase("build")
+
+    s: dict = recorder.get_snapshot()["load_bar_data"]
+    assert s["count"] == 2
+    assert s["errors"] == 0
+    assert s["rows"] == 6
+    assert s["bytes"] == 2 * int(df.memory_usage(index=True, deep=False).sum())
+    assert set(s["phases"]) == {"query", "build"}
+    assert sum(s["phases"].values()) <= s["elapsed"]
+    assert 0 < s["max_elapsed"] <= s["elapsed"]
+
+
+def test_max_elapsed() -> None:
+    """最大耗时取所有调用中的最大值"""
+    recorder: StatsRecorder = StatsRecorder()
+
+    recorder.update(CallRecord("get_bar_overview", elapsed=0.5))
+    recorder.update(CallRecord("get_bar_overview", elapsed=2.0))
+    recorder.update(CallRecord("get_bar_overview", elapsed=1.0))
+
+    s: dict = recorder.get_snapshot()["get_bar_overview"]
+    assert s["max_elapsed"] == 2.0
+    assert s["elapsed"] == pytest.approx(3.5)
+
+
+def test_error_is_recorded() -> None:
+    """调用抛出异常时仍然提交记录并标记失败"""
+    recorder: StatsRecorder = StatsRecorder()
+    recorder.enabled = True
+
+    records: list[CallRecord] = []
+    recorder.add_hook(records.append)
+
+    with pytest.raises(RuntimeError):
+        with recorder.start("save_bar_data") as timer:
+            timer.phase("convert")
+            raise RuntimeError("append failed")
+
+    assert recorder.get_snapshot()["save_bar_data"]["errors"] == 1
+
+    record: CallRecord = records[0]
+    assert not record.ok
+    assert record.error == "RuntimeError: append failed"
+    assert "convert" in record.phases
+
+
+def test_snapshot_is_copy_and_reset() -> None:
+    """快照为深拷贝，reset清空统计"""
+    recorder: StatsRecorder = StatsRecorder()
+    recorder.update(CallRecord("delete_bar_data", phases={"count": 1.0}, rows=5))
+
+    snapshot: dict = recorder.get_snapshot()
+    snapshot["delete_bar_data"]["rows"] = 0
+    snapshot["delete_bar_data"]["phases"]["count"] = 0
+
+    s: dict = recorder.get_snapshot()["delete_bar_data"]
+    assert s["rows"] == 5
+    assert s["phases"]["count"] == 1.0
+
+    recorder.reset()
+    assert recorder.get_snapshot() == {}
+
+
+def test_hook_add_and_remove() -> None:
+    """回调函数的添加、去重和移除"""
+    recorder: StatsRecorder = StatsRecorder()
+
+    records: list[CallRecord] = []
+    recorder.add_hook(records.append)
+    recorder.add_hook(records.append)
+
+    recorder.update(CallRecord("get_tick_overview"))
+    assert len(records) == 1
+
+    recorder.remove_hook(records.append)
+    recorder.remove_hook(records.append)
+
+    recorder.update(CallRecord("get_tick_overview"))
+    assert len(records) == 1
+
+
+def test_hook_error_is_isolated() -> None:
+    """回调函数出错不影响其他回调和调用结果"""
+    recorder: StatsRecorder = StatsRecorder()
+    recorder.enabled = True
+
+    def broken_hook(record: CallRecord) -> None:
+        raise ConnectionError("exporter unreachable")
+
+    records: list[CallRecord] = []
+    recorder.add_hook(broken_hook)
+    recorder.add_hook(records.append)
+
+    with recorder.start("save_tick_data") as timer:
+        timer.phase("append")
+
+    assert len(records) == 1
+    assert records[0].ok
+    assert recorder.get_snapshot()["save_tick_data"]["count"] == 1
@@ -1,3 +1,4 @@
+from collections.abc import Callable
 from datetime import datetime
 
 import numpy as np
@@ -23,6 +24,7 @@ from .dolphindb_script import (
     CREATE_BAROVERVIEW_TABLE_SCRIPT,
     CREATE_TICKOVERVIEW_TABLE_SCRIPT
 )
+from .dolphindb_stats import StatsRecorder, CallRecord
 
 
 class DolphindbDatabase(BaseDatabase):
@@ -36,6 +38,9 @@ class DolphindbDatabase(BaseDatabase):
         self.port: int = SETTINGS["database.port"]
         self.db_path: str = "dfs://" + SETTINGS["database.database"]
 
+        # 调用统计（默认关闭）
+        self.recorder: StatsRecorder = StatsRecorder()
+
         # 连接数据库
         self.session: ddb.session = ddb.session()
         self.session.connect(self.host, self.port, self.user, self.password)
@@ -56,226 +61,268 @@ class DolphindbDatabase(BaseDatabase):
         if not self.session.isClosed():
             self.session.close()
 
-    def save_bar_data(self, bars: list[BarData], stream: bool = False) -> bool:
-        """保存k线数据"""
-        # 读取主键参数
-        bar: BarData = bars[0]
-        symbol: str = bar.symbol
-        exchange: Exchange = bar.exchange
-        interval: Interval = bar.interval
+    def set_stats_enabled(self, enabled: bool) -> None:
+        """开启或关闭调用统计"""
+        self.recorder.enabled = enabled
 
-        # 转换为DatFrame写入数据库
-        data: list[dict] = []
+    def add_stats_hook(self, hook: Callable[[CallRecord], None]) -> None:
+        """添加调用统计回调函数，每次调用结束后推送CallRecord"""
+        self.recorder.add_hook(hook)
 
-        for bar in bars:
-            dt: np.datetime64 = np.datetime64(convert_tz(bar.datetime))
+    def remove_stats_hook(self, hook: Callable[[CallRecord], None]) -> None:
+        """移除调用统计回调函数"""
+        self.recorder.remove_hook(hook)
 
-            d: dict = {
-                "symbol": symbol,
-                "exchange": exchange.value,
-                "datetime": dt,
-                "interval": interval.value,
-                "volume": float(bar.volume),
-                "turnover": float(bar.turnover),
-                "open_interest": float(bar.open_interest),
-                "open_price": float(bar.open_price),
-                "high_price": float(bar.high_price),
-                "low_price": float(bar.low_price),
-                "close_price": float(bar.close_price)
-            }
+    def get_stats(self) -> dict[str, dict]:
+        """获取各接口函数的调用统计快照"""
+        return self.recorder.get_snapshot()
 
-            data.append(d)
+    def reset_stats(self) -> None:
+        """清空调用统计"""
+        self.recorder.reset()
 
-        df: pd.DataFrame = pd.DataFrame.from_records(data)
-        del data
-        gc.collect()
-
-        appender: ddb.PartitionedTableAppender = ddb.PartitionedTableAppender(self.db_path, "bar", "datetime", self.pool)
-        appender.append(df)
-
-        # 计算已有K线数据的汇总
-        overview_table = self.session.loadTable(tableName="baroverview", dbPath=self.db_path)
-        overview: pd.DataFrame = (
-            overview_table.select('*')
-            .where(f'symbol="{symbol}"')
-            .where(f'exchange="{exchange.value}"')
-            .where(f'interval="{interval.value}"')
-            .toDF()
-        )
-
-        begin_dt: np.datetime64 = np.datetime64(convert_tz(bars[0].datetime))
-        end_dt: np.datetime64 = np.datetime64(convert_tz(bars[-1].datetime))
-
-        if overview.empty:
-            start: datetime | np.datetime64 = begin_dt
-            end: datetime | np.datetime64 = end_dt
-            count: int = len(bars)
-        elif stream:
-            start = overview["start"][0]
-            end = end_dt
-            count = overview["count"][0] + len(bars)
-        else:
-            start = min(begin_dt, overview["start"][0])
-            end = max(end_dt, overview["end"][0])
-
-            bar_table = self.session.loadTable(tableName="bar", dbPath=self.db_path)
-
-            df_count: pd.DataFrame = (
-                bar_table.select('count(*)')
+    def save_bar_data(self, bars: list[BarData], stream: bool = False) -> bool:
+        """保存k线数据"""
+        with self.recorder.start("save_bar_data") as timer:
+            # 读取主键参数
+            bar: BarData = bars[0]
+            symbol: str = bar.symbol
+            exchange: Exchange = bar.exchange
+            interval: Interval = bar.interval
+
+            # 转换为DatFrame写入数据库
+            data: list[dict] = []
+
+            for bar in bars:
+                dt: np.datetime64 = np.datetime64(convert_tz(bar.datetime))
+
+                d: dict = {
+                    "symbol": symbol,
+                    "exchange": exchange.value,
+                    "datetime": dt,
+                    "interval": interval.value,
+                    "volume": float(bar.volume),
+                    "turnover": float(bar.turnover),
+                    "open_interest": float(bar.open_interest),
+                    "open_price": float(bar.open_price),
+                    "high_price": float(bar.high_price),
+                    "low_price": float(bar.low_price),
+                    "close_price": float(bar.close_price)
+                }
+
+                data.append(d)
+
+            df: pd.DataFrame = pd.DataFrame.from_records(data)
+
+            timer.add_frame(df)
+            timer.phase("convert")
+
+            del data
+            gc.collect()
+            timer.phase("gc")
+
+            appender: ddb.PartitionedTableAppender = ddb.PartitionedTableAppender(self.db_path, "bar", "datetime", self.pool)
+            appender.append(df)
+            timer.phase("append")
+
+            # 计算已有K线数据的汇总
+            overview_table = self.session.loadTable(tableName="baroverview", dbPath=self.db_path)
+            overview: pd.DataFrame = (
+                overview_table.select('*')
                 .where(f'symbol="{symbol}"')
                 .where(f'exchange="{exchange.value}"')
                 .where(f'interval="{interval.value}"')
                 .toDF()
             )
 
-            count = df_count["count"][0]
+            timer.phase("overview_query")
 
-        # 更新K线汇总数据
-        data = []
+            begin_dt: np.datetime64 = np.datetime64(convert_tz(bars[0].datetime))
+            end_dt: np.datetime64 = np.datetime64(convert_tz(bars[-1].datetime))
 
-        dt = np.datetime64(datetime(2022, 1, 1))    # 该时间戳仅用于分区
+            if overview.empty:
+                start: datetime | np.datetime64 = begin_dt
+                end: datetime | np.datetime64 = end_dt
+                count: int = len(bars)
+            elif stream:
+                start = overview["start"][0]
+                end = end_dt
+                count = overview["count"][0] + len(bars)
+            else:
+                start = min(begin_dt, overview["start"][0])
+                end = max(end_dt, overview["end"][0])
 
-        d = {
-            "symbol": symbol,
-            "exchange": exchange.value,
-            "interval": interval.value,
-            "count": count,
-            "start": start,
-            "end": end,
-            "datetime": dt,
-        }
-        data.append(d)
+                bar_table = self.session.loadTable(tableName="bar", dbPath=self.db_path)
 
-        df = pd.DataFrame.from_records(data)
+                df_count: pd.DataFrame = (
+                    bar_table.select('count(*)')
+                    .where(f'symbol="{symbol}"')
+                    .where(f'exchange="{exchange.value}"')
+                    .where(f'interval="{interval.value}"')
+                    .toDF()
+                )
 
-        appender = ddb.PartitionedTableAppender(self.db_path, "baroverview", "datetime", self.pool)
-        appender.append(df)
+                count = df_count["count"][0]
+                timer.phase("count")
 
-        return True
+            # 更新K线汇总数据
+            data = []
 
-    def save_tick_data(self, ticks: list[TickData], stream: bool = False) -> bool:
-        """保存TICK数据"""
-        # 读取主键参数
-        tick: TickData = ticks[0]
-        symbol: str = tick.symbol
-        exchange: Exchange = tick.exchange
-
-        data: list[dict] = []
+            dt = np.datetime64(datetime(2022, 1, 1))    # 该时间戳仅用于分区
 
-        for tick in ticks:
-            dt: np.datetime64 = np.datetime64(convert_tz(tick.datetime))
-
-            d: dict = {
-                "symbol": tick.symbol,
-                "exchange": tick.exchange.value,
+            d = {
+                "symbol": symbol,
+                "exchange": exchange.value,
+                "interval": interval.value,
+                "count": count,
+                "start": start,
+                "end": end,
                 "datetime": dt,
-
-                "name": tick.name,
-                "volume": float(tick.volume),
-                "turnover": float(tick.turnover),
-                "open_interest": float(tick.open_interest),
-                "last_price": float(tick.last_price),
-                "last_volume": float(tick.last_volume),
-                "limit_up": float(tick.limit_up),
-                "limit_down": float(tick.limit_down),
-
-                "open_price": float(tick.open_price),
-                "high_price": float(tick.high_price),
-                "low_price": float(tick.low_price),
-                "pre_close": float(tick.pre_close),
-
-                "bid_price_1": float(tick.bid_price_1),
-                "bid_price_2": float(tick.bid_price_2),
-                "bid_price_3": float(tick.bid_price_3),
-                "bid_price_4": float(tick.bid_price_4),
-                "bid_price_5": float(tick.bid_price_5),
-
-                "ask_price_1": float(tick.ask_price_1),
-                "ask_price_2": float(tick.ask_price_2),
-                "ask_price_3": float(tick.ask_price_3),
-                "ask_price_4": float(tick.ask_price_4),
-                "ask_price_5": float(tick.ask_price_5),
-
-                "bid_volume_1": float(tick.bid_volume_1),
-                "bid_volume_2": float(tick.bid_volume_2),
-                "bid_volume_3": float(tick.bid_volume_3),
-                "bid_volume_4": float(tick.bid_volume_4),
-                "bid_volume_5": float(tick.bid_volume_5),
-
-                "ask_volume_1": float(tick.ask_volume_1),
-                "ask_volume_2": float(tick.ask_volume_2),
-                "ask_volume_3": float(tick.ask_volume_3),
-                "ask_volume_4": float(tick.ask_volume_4),
-                "ask_volume_5": float(tick.ask_volume_5),
-
-                "localtime": np.datetime64(tick.localtime),
             }
-
             data.append(d)
 
-        df: pd.DataFrame = pd.DataFrame.from_records(data)
-        del data
-        gc.collect()
-
-        appender: ddb.PartitionedTableAppender = ddb.PartitionedTableAppender(self.db_path, "tick", "datetime", self.pool)
-        appender.append(df)
-
-        # 计算已有Tick数据的汇总
-        overview_table = self.session.loadTable(tableName="tickoverview", dbPath=self.db_path)
-        overview: pd.DataFrame = (
-            overview_table.select('*')
-            .where(f'symbol="{symbol}"')
-            .where(f'exchange="{exchange.value}"')
-            .toDF()
-        )
-
-        begin_dt: np.datetime64 = np.datetime64(convert_tz(ticks[0].datetime))
-        end_dt: np.datetime64 = np.datetime64(convert_tz(ticks[-1].datetime))
-
-        if overview.empty:
-            start: datetime | np.datetime64 = begin_dt
-            end: datetime | np.datetime64 = end_dt
-            count: int = len(ticks)
-        elif stream:
-            start = overview["start"][0]
-            end = end_dt
-            count = overview["count"][0] + len(ticks)
-        else:
-            start = min(begin_dt, overview["start"][0])
-            end = max(end_dt, overview["end"][0])
-
-            bar_table = self.session.loadTable(tableName="tick", dbPath=self.db_path)
-
-            df_count: pd.DataFrame = (
-                bar_table.select('count(*)')
+            df = pd.DataFrame.from_records(data)
+
+            appender = ddb.PartitionedTableAppender(self.db_path, "baroverview", "datetime", self.pool)
+            appender.append(df)
+            timer.phase("overview_append")
+
+            return True
+
+    def save_tick_data(self, ticks: list[TickData], stream: bool = False) -> bool:
+        """保存TICK数据"""
+        with self.recorder.start("save_tick_data") as timer:
+            # 读取主键参数
+            tick: TickData = ticks[0]
+            symbol: str = tick.symbol
+            exchange: Exchange = tick.exchange
+
+            data: list[dict] = []
+
+            for tick in ticks:
+                dt: np.datetime64 = np.datetime64(convert_tz(tick.datetime))
+
+                d: dict = {
+                    "symbol": tick.symbol,
+                    "exchange": tick.exchange.value,
+                    "datetime": dt,
+
+                    "name": tick.name,
+                    "volume": float(tick.volume),
+                    "turnover": float(tick.turnover),
+                    "open_interest": float(tick.open_interest),
+                    "last_price": float(tick.last_price),
+                    "last_volume": float(tick.last_volume),
+                    "limit_up": float(tick.limit_up),
+                    "limit_down": float(tick.limit_down),
+
+                    "open_price": float(tick.open_price),
+                    "high_price": float(tick.high_price),
+                    "low_price": float(tick.low_price),
+                    "pre_close": float(tick.pre_close),
+
+                    "bid_price_1": float(tick.bid_price_1),
+                    "bid_price_2": float(tick.bid_price_2),
+                    "bid_price_3": float(tick.bid_price_3),
+                    "bid_price_4": float(tick.bid_price_4),
+                    "bid_price_5": float(tick.bid_price_5),
+
+                    "ask_price_1": float(tick.ask_price_1),
+                    "ask_price_2": float(tick.ask_price_2),
+                    "ask_price_3": float(tick.ask_price_3),
+                    "ask_price_4": float(tick.ask_price_4),
+                    "ask_price_5": float(tick.ask_price_5),
+
+                    "bid_volume_1": float(tick.bid_volume_1),
+                    "bid_volume_2": float(tick.bid_volume_2),
+                    "bid_volume_3": float(tick.bid_volume_3),
+                    "bid_volume_4": float(tick.bid_volume_4),
+                    "bid_volume_5": float(tick.bid_volume_5),
+
+                    "ask_volume_1": float(tick.ask_volume_1),
+                    "ask_volume_2": float(tick.ask_volume_2),
+                    "ask_volume_3": float(tick.ask_volume_3),
+                    "ask_volume_4": float(tick.ask_volume_4),
+                    "ask_volume_5": float(tick.ask_volume_5),
+
+                    "localtime": np.datetime64(tick.localtime),
+                }
+
+                data.append(d)
+
+            df: pd.DataFrame = pd.DataFrame.from_records(data)
+
+            timer.add_frame(df)
+            timer.phase("convert")
+
+            del data
+            gc.collect()
+            timer.phase("gc")
+
+            appender: ddb.PartitionedTableAppender = ddb.PartitionedTableAppender(self.db_path, "tick", "datetime", self.pool)
+            appender.append(df)
+            timer.phase("append")
+
+            # 计算已有Tick数据的汇总
+            overview_table = self.session.loadTable(tableName="tickoverview", dbPath=self.db_path)
+            overview: pd.DataFrame = (
+                overview_table.select('*')
                 .where(f'symbol="{symbol}"')
                 .where(f'exchange="{exchange.value}"')
                 .toDF()
             )
 
-            count = df_count["count"][0]
+            timer.phase("overview_query")
+
+            begin_dt: np.datetime64 = np.datetime64(convert_tz(ticks[0].datetime))
+            end_dt: np.datetime64 = np.datetime64(convert_tz(ticks[-1].datetime))
+
+            if overview.empty:
+                start: datetime | np.datetime64 = begin_dt
+                end: datetime | np.datetime64 = end_dt
+                count: int = len(ticks)
+            elif stream:
+                start = overview["start"][0]
+                end = end_dt
+                count = overview["count"][0] + len(ticks)
+            else:
+                start = min(begin_dt, overview["start"][0])
+                end = max(end_dt, overview["end"][0])
+
+                bar_table = self.session.loadTable(tableName="tick", dbPath=self.db_path)
 
-        # 更新Tick汇总数据
-        data = []
+                df_count: pd.DataFrame = (
+                    bar_table.select('count(*)')
+                    .where(f'symbol="{symbol}"')
+                    .where(f'exchange="{exchange.value}"')
+                    .toDF()
+                )
 
-        dt = np.datetime64(datetime(2022, 1, 1))    # 该时间戳仅用于分区
+                count = df_count["count"][0]
+                timer.phase("count")
 
-        d = {
-            "symbol": symbol,
-            "exchange": exchange.value,
-            "count": count,
-            "start": start,
-            "end": end,
-            "datetime": dt,
-        }
-        data.append(d)
+            # 更新Tick汇总数据
+            data = []
 
-        df = pd.DataFrame.from_records(data)
+            dt = np.datetime64(datetime(2022, 1, 1))    # 该时间戳仅用于分区
 
-        appender = ddb.PartitionedTableAppender(self.db_path, "tickoverview", "datetime", self.pool)
-        appender.append(df)
+            d = {
+                "symbol": symbol,
+                "exchange": exchange.value,
+                "count": count,
+                "start": start,
+                "end": end,
+                "datetime": dt,
+            }
+            data.append(d)
 
-        return True
+            df = pd.DataFrame.from_records(data)
+
+            appender = ddb.PartitionedTableAppender(self.db_path, "tickoverview", "datetime", self.pool)
+            appender.append(df)
+            timer.phase("overview_append")
+
+            return True
 
     def load_bar_data(
         self,
@@ -286,52 +333,58 @@ class DolphindbDatabase(BaseDatabase):
         end: datetime
     ) -> list[BarData]:
         """读取K线数据"""
-        # 转换时间格式
-        _start: np.datetime64 = np.datetime64(start)
-        start_str: str = str(_start).replace("-", ".")
-
-        _end: np.datetime64 = np.datetime64(end)
-        end_str: str = str(_end).replace("-", ".")
-
-        table: ddb.Table = self.session.loadTable(tableName="bar", dbPath=self.db_path)
-
-        df: pd.DataFrame = (
-            table.select('*')
-            .where(f'symbol="{symbol}"')
-            .where(f'exchange="{exchange.value}"')
-            .where(f'interval="{interval.value}"')
-            .where(f'datetime>={start_str}')
-            .where(f'datetime<={end_str}')
-            .toDF()
-        )
-
-        if df.empty:
-            return []
-
-        df.set_index("datetime", inplace=True)
-        df = df.tz_localize(DB_TZ.key)
-
-        # 转换为BarData格式
-        bars: list[BarData] = []
-
-        for tp in df.itertuples():
-            bar = BarData(
-                symbol=symbol,
-                exchange=exchange,
-                datetime=tp.Index.to_pydatetime(),
-                interval=interval,
-                volume=tp.volume,
-                turnover=tp.turnover,
-                open_interest=tp.open_interest,
-                open_price=tp.open_price,
-                high_price=tp.high_price,
-                low_price=tp.low_price,
-                close_price=tp.close_price,
-                gateway_name="DB"
+        with self.recorder.start("load_bar_data") as timer:
+            # 转换时间格式
+            _start: np.datetime64 = np.datetime64(start)
+            start_str: str = str(_start).replace("-", ".")
+
+            _end: np.datetime64 = np.datetime64(end)
+            end_str: str = str(_end).replace("-", ".")
+
+            table: ddb.Table = self.session.loadTable(tableName="bar", dbPath=self.db_path)
+
+            df: pd.DataFrame = (
+                table.select('*')
+                .where(f'symbol="{symbol}"')
+                .where(f'exchange="{exchange.value}"')
+                .where(f'interval="{interval.value}"')
+                .where(f'datetime>={start_str}')
+                .where(f'datetime<={end_str}')
+                .toDF()
             )
-            bars.append(bar)
 
-        return bars
+            timer.add_frame(df)
+            timer.phase("query")
+
+            if df.empty:
+                return []
+
+            df.set_index("datetime", inplace=True)
+            df = df.tz_localize(DB_TZ.key)
+            timer.phase("convert")
+
+            # 转换为BarData格式
+            bars: list[BarData] = []
+
+            for tp in df.itertuples():
+                bar = BarData(
+                    symbol=symbol,
+                    exchange=exchange,
+                    datetime=tp.Index.to_pydatetime(),
+                    interval=interval,
+                    volume=tp.volume,
+                    turnover=tp.turnover,
+                    open_interest=tp.open_interest,
+                    open_price=tp.open_price,
+                    high_price=tp.high_price,
+                    low_price=tp.low_price,
+                    close_price=tp.close_price,
+                    gateway_name="DB"
+                )
+                bars.append(bar)
+
+            timer.phase("build")
+            return bars
 
     def load_tick_data(
         self,
@@ -341,77 +394,83 @@ class DolphindbDatabase(BaseDatabase):
         end: datetime
     ) -> list[TickData]:
         """读取Tick数据"""
-        # 转换时间格式
-        _start: np.datetime64 = np.datetime64(start)
-        start_str: str = str(_start).replace("-", ".")
-
-        _end: np.datetime64 = np.datetime64(end)
-        end_str: str = str(_end).replace("-", ".")
-
-        # 读取数据DataFrame
-        table: ddb.Table = self.session.loadTable(tableName="tick", dbPath=self.db_path)
-
-        df: pd.DataFrame = (
-            table.select('*')
-            .where(f'symbol="{symbol}"')
-            .where(f'exchange="{exchange.value}"')
-            .where(f'datetime>={start_str}')
-            .where(f'datetime<={end_str}')
-            .toDF()
-        )
-
-        if df.empty:
-            return []
-
-        df.set_index("datetime", inplace=True)
-        df = df.tz_localize(DB_TZ.key)
-
-        # 转换为TickData格式
-        ticks: list[TickData] = []
-
-        for tp in df.itertuples():
-            tick: TickData = TickData(
-                symbol=symbol,
-                exchange=exchange,
-                datetime=tp.Index.to_pydatetime(),
-                name=tp.name,
-                volume=tp.volume,
-                turnover=tp.turnover,
-                open_interest=tp.open_interest,
-                last_price=tp.last_price,
-                last_volume=tp.last_volume,
-                limit_up=tp.limit_up,
-                limit_down=tp.limit_down,
-                open_price=tp.open_price,
-                high_price=tp.high_price,
-                low_price=tp.low_price,
-                pre_close=tp.pre_close,
-                bid_price_1=tp.bid_price_1,
-                bid_price_2=tp.bid_price_2,
-                bid_price_3=tp.bid_price_3,
-                bid_price_4=tp.bid_price_4,
-                bid_price_5=tp.bid_price_5,
-                ask_price_1=tp.ask_price_1,
-                ask_price_2=tp.ask_price_2,
-                ask_price_3=tp.ask_price_3,
-                ask_price_4=tp.ask_price_4,
-                ask_price_5=tp.ask_price_5,
-                bid_volume_1=tp.bid_volume_1,
-                bid_volume_2=tp.bid_volume_2,
-                bid_volume_3=tp.bid_volume_3,
-                bid_volume_4=tp.bid_volume_4,
-                bid_volume_5=tp.bid_volume_5,
-                ask_volume_1=tp.ask_volume_1,
-                ask_volume_2=tp.ask_volume_2,
-                ask_volume_3=tp.ask_volume_3,
-                ask_volume_4=tp.ask_volume_4,
-                ask_volume_5=tp.ask_volume_5,
-                localtime=tp.localtime,
-                gateway_name="DB"
+        with self.recorder.start("load_tick_data") as timer:
+            # 转换时间格式
+            _start: np.datetime64 = np.datetime64(start)
+            start_str: str = str(_start).replace("-", ".")
+
+            _end: np.datetime64 = np.datetime64(end)
+            end_str: str = str(_end).replace("-", ".")
+
+            # 读取数据DataFrame
+            table: ddb.Table = self.session.loadTable(tableName="tick", dbPath=self.db_path)
+
+            df: pd.DataFrame = (
+                table.select('*')
+                .where(f'symbol="{symbol}"')
+                .where(f'exchange="{exchange.value}"')
+                .where(f'datetime>={start_str}')
+                .where(f'datetime<={end_str}')
+                .toDF()
             )
-            ticks.append(tick)
 
-        return ticks
+            timer.add_frame(df)
+            timer.phase("query")
+
+            if df.empty:
+                return []
+
+            df.set_index("datetime", inplace=True)
+            df = df.tz_localize(DB_TZ.key)
+            timer.phase("convert")
+
+            # 转换为TickData格式
+            ticks: list[TickData] = []
+
+            for tp in df.itertuples():
+                tick: TickData = TickData(
+                    symbol=symbol,
+                    exchange=exchange,
+                    datetime=tp.Index.to_pydatetime(),
+                    name=tp.name,
+                    volume=tp.volume,
+                    turnover=tp.turnover,
+                    open_interest=tp.open_interest,
+                    last_price=tp.last_price,
+                    last_volume=tp.last_volume,
+                    limit_up=tp.limit_up,
+                    limit_down=tp.limit_down,
+                    open_price=tp.open_price,
+                    high_price=tp.high_price,
+                    low_price=tp.low_price,
+                    pre_close=tp.pre_close,
+                    bid_price_1=tp.bid_price_1,
+                    bid_price_2=tp.bid_price_2,
+                    bid_price_3=tp.bid_price_3,
+                    bid_price_4=tp.bid_price_4,
+                    bid_price_5=tp.bid_price_5,
+                    ask_price_1=tp.ask_price_1,
+                    ask_price_2=tp.ask_price_2,
+                    ask_price_3=tp.ask_price_3,
+                    ask_price_4=tp.ask_price_4,
+                    ask_price_5=tp.ask_price_5,
+                    bid_volume_1=tp.bid_volume_1,
+                    bid_volume_2=tp.bid_volume_2,
+                    bid_volume_3=tp.bid_volume_3,
+                    bid_volume_4=tp.bid_volume_4,
+                    bid_volume_5=tp.bid_volume_5,
+                    ask_volume_1=tp.ask_volume_1,
+                    ask_volume_2=tp.ask_volume_2,
+                    ask_volume_3=tp.ask_volume_3,
+                    ask_volume_4=tp.ask_volume_4,
+                    ask_volume_5=tp.ask_volume_5,
+                    localtime=tp.localtime,
+                    gateway_name="DB"
+                )
+                ticks.append(tick)
+
+            timer.phase("build")
+            return ticks
 
     def delete_bar_data(
         self,
@@ -420,39 +479,44 @@ class DolphindbDatabase(BaseDatabase):
         interval: Interval
     ) -> int:
         """删除K线数据"""
-        # 加载数据表
-        table: ddb.Table = self.session.loadTable(tableName="bar", dbPath=self.db_path)
-
-        # 统计数据量
-        df: pd.DataFrame = (
-            table.select('count(*)')
-            .where(f'symbol="{symbol}"')
-            .where(f'exchange="{exchange.value}"')
-            .where(f'interval="{interval.value}"')
-            .toDF()
-        )
-        count: int = df["count"][0]
-
-        # 删除K线数据
-        (
-            table.delete()
-            .where(f'symbol="{symbol}"')
-            .where(f'exchange="{exchange.value}"')
-            .where(f'interval="{interval.value}"')
-            .execute()
-        )
-
-        # 删除K线汇总
-        table = self.session.loadTable(tableName="baroverview", dbPath=self.db_path)
-        (
-            table.delete()
-            .where(f'symbol="{symbol}"')
-            .where(f'exchange="{exchange.value}"')
-            .where(f'interval="{interval.value}"')
-            .execute()
-        )
-
-        return count
+        with self.recorder.start("delete_bar_data") as timer:
+            # 加载数据表
+            table: ddb.Table = self.session.loadTable(tableName="bar", dbPath=self.db_path)
+
+            # 统计数据量
+            df: pd.DataFrame = (
+                table.select('count(*)')
+                .where(f'symbol="{symbol}"')
+                .where(f'exchange="{exchange.value}"')
+                .where(f'interval="{interval.value}"')
+                .toDF()
+            )
+            count: int = df["count"][0]
+            timer.add_rows(count)
+            timer.phase("count")
+
+            # 删除K线数据
+            (
+                table.delete()
+                .where(f'symbol="{symbol}"')
+                .where(f'exchange="{exchange.value}"')
+                .where(f'interval="{interval.value}"')
+                .execute()
+            )
+            timer.phase("delete")
+
+            # 删除K线汇总
+            table = self.session.loadTable(tableName="baroverview", dbPath=self.db_path)
+            (
+                table.delete()
+                .where(f'symbol="{symbol}"')
+                .where(f'exchange="{exchange.value}"')
+                .where(f'interval="{interval.value}"')
+                .execute()
+            )
+            timer.phase("overview_delete")
+
+            return count
 
     def delete_tick_data(
         self,
@@ -460,72 +524,87 @@ class DolphindbDatabase(BaseDatabase):
         exchange: Exchange
     ) -> int:
         """删除Tick数据"""
-        # 加载数据表
-        table: ddb.Table = self.session.loadTable(tableName="tick", dbPath=self.db_path)
-
-        # 统计数据量
-        df: pd.DataFrame = (
-            table.select('count(*)')
-            .where(f'symbol="{symbol}"')
-            .where(f'exchange="{exchange.value}"')
-            .toDF()
-        )
-        count: int = df["count"][0]
-
-        # 删除Tick数据
-        (
-            table.delete()
-            .where(f'symbol="{symbol}"')
-            .where(f'exchange="{exchange.value}"')
-            .execute()
-        )
-
-        # 删除Tick汇总
-        table = self.session.loadTable(tableName="tickoverview", dbPath=self.db_path)
-        (
-            table.delete()
-            .where(f'symbol="{symbol}"')
-            .where(f'exchange="{exchange.value}"')
-            .execute()
-        )
-
-        return count
+        with self.recorder.start("delete_tick_data") as timer:
+            # 加载数据表
+            table: ddb.Table = self.session.loadTable(tableName="tick", dbPath=self.db_path)
+
+            # 统计数据量
+            df: pd.DataFrame = (
+                table.select('count(*)')
+                .where(f'symbol="{symbol}"')
+                .where(f'exchange="{exchange.value}"')
+                .toDF()
+            )
+            count: int = df["count"][0]
+            timer.add_rows(count)
+            timer.phase("count")
+
+            # 删除Tick数据
+            (
+                table.delete()
+                .where(f'symbol="{symbol}"')
+                .where(f'exchange="{exchange.value}"')
+                .execute()
+            )
+            timer.phase("delete")
+
+            # 删除Tick汇总
+            table = self.session.loadTable(tableName="tickoverview", dbPath=self.db_path)
+            (
+                table.delete()
+                .where(f'symbol="{symbol}"')
+                .where(f'exchange="{exchange.value}"')
+                .execute()
+            )
+            timer.phase("overview_delete")
+
+            return count
 
     def get_bar_overview(self) -> list[BarOverview]:
         """"查询数据库中的K线汇总信息"""
-        table: ddb.Table = self.session.loadTable(tableName="baroverview", dbPath=self.db_path)
-        df: pd.DataFrame = table.select('*').toDF()
-
-        overviews: list[BarOverview] = []
-
-        for tp in df.itertuples():
-            overview: BarOverview = BarOverview(
-                symbol=tp.symbol,
-                exchange=Exchange(tp.exchange),
-                interval=Interval(tp.interval),
-                count=tp.count,
-                start=datetime.fromtimestamp(tp.start.to_pydatetime().timestamp(), DB_TZ),
-                end=datetime.fromtimestamp(tp.end.to_pydatetime().timestamp(), DB_TZ),
-            )
-            overviews.append(overview)
+        with self.recorder.start("get_bar_overview") as timer:
+            table: ddb.Table = self.session.loadTable(tableName="baroverview", dbPath=self.db_path)
+            df: pd.DataFrame = table.select('*').toDF()
 
-        return overviews
+            timer.add_frame(df)
+            timer.phase("query")
+
+            overviews: list[BarOverview] = []
+
+            for tp in df.itertuples():
+                overview: BarOverview = BarOverview(
+                    symbol=tp.symbol,
+                    exchange=Exchange(tp.exchange),
+                    interval=Interval(tp.interval),
+                    count=tp.count,
+                    start=datetime.fromtimestamp(tp.start.to_pydatetime().timestamp(), DB_TZ),
+                    end=datetime.fromtimestamp(tp.end.to_pydatetime().timestamp(), DB_TZ),
+                )
+                overviews.append(overview)
+
+            timer.phase("build")
+            return overviews
 
     def get_tick_overview(self) -> list[TickOverview]:
         """"查询数据库中的K线汇总信息"""
-        table: ddb.Table = self.session.loadTable(tableName="tickoverview", dbPath=self.db_path)
-        df: pd.DataFrame = table.select('*').toDF()
-
-        overviews: list[TickOverview] = []
-
-        for tp in df.itertuples():
-            overview: TickOverview = TickOverview(
-                symbol=tp.symbol,
-                exchange=Exchange(tp.exchange),
-                count=tp.count,
-                start=datetime.fromtimestamp(tp.start.to_pydatetime().timestamp(), DB_TZ),
-                end=datetime.fromtimestamp(tp.end.to_pydatetime().timestamp(), DB_TZ),
-            )
-            overviews.append(overview)
-
-        return overviews
+        with self.recorder.start("get_tick_overview") as timer:
+            table: ddb.Table = self.session.loadTable(tableName="tickoverview", dbPath=self.db_path)
+            df: pd.DataFrame = table.select('*').toDF()
+
+            timer.add_frame(df)
+            timer.phase("query")
+
+            overviews: list[TickOverview] = []
+
+            for tp in df.itertuples():
+                overview: TickOverview = TickOverview(
+                    symbol=tp.symbol,
+                    exchange=Exchange(tp.exchange),
+                    count=tp.count,
+                    start=datetime.fromtimestamp(tp.start.to_pydatetime().timestamp(), DB_TZ),
+                    end=datetime.fromtimestamp(tp.end.to_pydatetime().timestamp(), DB_TZ),
+                )
+                overviews.append(overview)
+
+            timer.phase("build")
+            return overviews
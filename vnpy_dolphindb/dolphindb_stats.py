@@ -0,0 +1,195 @@
+from collections.abc import Callable
+from copy import deepcopy
+from dataclasses import dataclass, field
+from threading import Lock
+from time import perf_counter
+from types import TracebackType
+
+import pandas as pd
+
+from vnpy.trader.logger import logger
+
+
+@dataclass
+class CallRecord:
+    """单次数据库调用的统计记录"""
+
+    method: str
+    phases: dict[str, float] = field(default_factory=dict)
+    rows: int = 0
+    nbytes: int = 0
+    elapsed: float = 0
+    error: str = ""
+
+    @property
+    def ok(self) -> bool:
+        """调用是否成功完成"""
+        return not self.error
+
+
+class CallTimer:
+    """单次调用的分阶段计时器，通过with语句使用"""
+
+    def __init__(self, recorder: "StatsRecorder", method: str) -> None:
+        """构造函数"""
+        self.recorder: StatsRecorder = recorder
+        self.record: CallRecord = CallRecord(method)
+
+        self.start: float = perf_counter()
+        self.last: float = self.start
+
+    def __enter__(self) -> "CallTimer":
+        """开始计时"""
+        self.start = perf_counter()
+        self.last = self.start
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None
+    ) -> None:
+        """结束计时，调用抛出异常时同样提交记录"""
+        if exc_type:
+            self.record.error = f"{exc_type.__name__}: {exc_value}"
+
+        self.finish()
+
+    def phase(self, name: str) -> None:
+        """记录从上一阶段结束到当前的耗时"""
+        now: float = perf_counter()
+
+        phases: dict[str, float] = self.record.phases
+        phases[name] = phases.get(name, 0) + now - self.last
+
+        self.last = now
+
+    def add_rows(self, rows: int) -> None:
+        """累计数据行数"""
+        self.record.rows += int(rows)
+
+    def add_frame(self, df: pd.DataFrame) -> None:
+        """累计DataFrame的行数和内存占用"""
+        self.record.rows += len(df)
+        self.record.nbytes += int(df.memory_usage(index=True, deep=False).sum())
+
+    def finish(self) -> None:
+        """结束计时并提交记录"""
+        self.record.elapsed = perf_counter() - self.start
+        self.recorder.update(self.record)
+
+
+class NullTimer:
+    """关闭统计时使用的空计时器"""
+
+    def __enter__(self) -> "NullTimer":
+        """空操作"""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None
+    ) -> None:
+        """空操作"""
+        pass
+
+    def phase(self, name: str) -> None:
+        """空操作"""
+        pass
+
+    def add_rows(self, rows: int) -> None:
+        """空操作"""
+        pass
+
+    def add_frame(self, df: pd.DataFrame) -> None:
+        """空操作"""
+        pass
+
+    def finish(self) -> None:
+        """空操作"""
+        pass
+
+
+NULL_TIMER: NullTimer = NullTimer()
+
+
+class StatsRecorder:
+    """数据库调用统计汇总"""
+
+    def __init__(self) -> None:
+        """构造函数"""
+        self.enabled: bool = False
+        self.hooks: list[Callable[[CallRecord], None]] = []
+
+        self.stats: dict[str, dict] = {}
+        self.lock: Lock = Lock()
+
+    def start(self, method: str) -> CallTimer | NullTimer:
+        """开始一次调用的计时"""
+        if not self.enabled:
+            return NULL_TIMER
+
+        return CallTimer(self, method)
+
+    def add_hook(self, hook: Callable[[CallRecord], None]) -> None:
+        """添加回调函数"""
+        with self.lock:
+            if hook not in self.hooks:
+                self.hooks.append(hook)
+
+    def remove_hook(self, hook: Callable[[CallRecord], None]) -> None:
+        """移除回调函数"""
+        with self.lock:
+            if hook in self.hooks:
+                self.hooks.remove(hook)
+
+    def update(self, record: CallRecord) -> None:
+        """汇总单次调用记录，并推送给回调函数"""
+        with self.lock:
+            s: dict | None = self.stats.get(record.method, None)
+            if not s:
+                s = {
+                    "count": 0,
+                    "errors": 0,
+                    "rows": 0,
+                    "bytes": 0,
+                    "elapsed": 0.0,
+                    "max_elapsed": 0.0,
+                    "phases": {},
+                }
+                self.stats[record.method] = s
+
+            s["count"] += 1
+            s["rows"] += record.rows
+            s["bytes"] += record.nbytes
+            s["elapsed"] += record.elapsed
+            s["max_elapsed"] = max(s["max_elapsed"], record.elapsed)
+
+            if record.error:
+                s["errors"] += 1
+
+            phases: dict[str, float] = s["phases"]
+            for name, cost in record.phases.items():
+                phases[name] = phases.get(name, 0) + cost
+
+            hooks: list[Callable[[CallRecord], None]] = list(self.hooks)
+
+        # 回调函数的异常不能影响数据库调用的结果
+        for hook in hooks:
+            try:
+                hook(record)
+            except Exception:
+                logger.exception(f"DolphinDB调用统计回调函数{hook}执行出错")
+
+    def get_snapshot(self) -> dict[str, dict]:
+        """获取当前统计数据的副本"""
+        with self.lock:
+            return deepcopy(self.stats)
+
+    def reset(self) -> None:
+        """清空统计数据"""
+        with self.lock:
+            self.stats.clear()